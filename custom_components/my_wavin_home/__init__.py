@@ -4,24 +4,29 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
 
+from .const import DOMAIN
 from .coordinator import HVACDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "my_wavin_home"
 PLATFORMS = [Platform.SENSOR, Platform.CLIMATE]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HVAC System from a config entry."""
     coordinator = HVACDataUpdateCoordinator(hass, entry)
-    
-    await coordinator.async_config_entry_first_refresh()
+    # Start without data so a slow Wavin website does not hold up Home Assistant
+    # startup; the platforms add their entities once the first refresh returns rooms
+    coordinator.data = {}
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+    )
+    
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
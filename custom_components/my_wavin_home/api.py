@@ -3,15 +3,51 @@ import logging
 import aiohttp
 import asyncio
 from typing import Any
-from bs4 import BeautifulSoup
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from selectolax.lexbor import LexborHTMLParser
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import re
+import time
+from yarl import URL
+from html import unescape
 
 _LOGGER = logging.getLogger(__name__)
 
-API_BASE_URL = "https://api.hvac-system.example.com"
-API_LOGIN_ENDPOINT = "/api/login"
-API_DATA_ENDPOINT = "/api/rooms/temperature"
+# Home Assistant pins the default headers of its sessions, so these are passed per request
+_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
+_BASE_HEADERS = {"User-Agent": _UA}
+_FORM_HEADERS = {
+    **_BASE_HEADERS,
+    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+}
+_SITE_URL = URL("https://www.mywavinhome.com/")
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# Settings pages fetched during a refresh are reused by a write issued right after it
+_SETTINGS_CACHE_TTL = 5.0
+# Upper bound on simultaneous requests to the Wavin website
+_MAX_CONCURRENT_REQUESTS = 5
+# A 401 triggers one re-login before the request is given up
+_MAX_AUTH_ATTEMPTS = 2
+
+# Selectors and patterns used to scrape the MyWavinHome pages
+_ROOM_SEL = ".items .listview"
+_ROOM_NAME_SEL = ".thermoInput"
+_ROOM_LINK_SEL = ".thermHeader a"
+_ROOM_DATA_SEL = ".thermHeader2"
+_NEXT_PAGE_SEL = ".next:not(.hidden)"
+_TARGET_TEMP_SEL = "#myModeVal"
+_IMAGES_SEL = '[src^="/images/"]'
+# Room state flags and the status image shown on the settings page while they are on
+_STATE_IMAGES = {
+    "is_heating_on": "/images/heat_1.png",
+    "is_cooling_on": "/images/cool_1.png",
+    "is_day_mode_on": "/images/day_1.png",
+    "is_night_mode_on": "/images/night_1.png",
+}
+_OUTSIDE_TEMP_SEL = '[style="font-size:20px;color:red; font-weight:bold;"]'
+_TEMP_BUTTONS_SEL = "#thermostatBG div[onclick]"
+_TEMP_SCRIPT_SEL = "#thermostatBG script"
+_SCRIPT_ID_RE = re.compile(r"\$\('#([a-zA-Z0-9]*)'\)")
+_OUTSIDE_TEMP_RE = re.compile(r'style="font-size:20px;color:red;\s*font-weight:bold;"[^>]*>([^<]+)<')
 
 class AuthenticationError(Exception):
     """Exception for authentication errors."""
@@ -22,107 +58,168 @@ class ConnectionError(Exception):
 class HVACApiClient:
     """API Client for HVAC System."""
 
-    def __init__(self, username: str, password: str, hass) -> None:
-        """Initialize the API client."""
+    def __init__(self, username: str, password: str, hass, session_id: str | None = None) -> None:
+        """Initialize the API client.
+
+        A session_id from an earlier login can be passed to skip the first login,
+        an expired one is replaced through the usual re-login on 401.
+        """
         self.username = username
         self.password = password
         self.hass = hass
-        self.session_id: str | None = None
+        self.session_id: str | None = session_id
         self._session: aiohttp.ClientSession | None = None
+        # (time.monotonic() of the fetch, raw settings page, values read on every poll)
+        self._settings_cache: dict[str, tuple[float, str, dict[str, Any]]] = {}
+        # Bumped when a room's settings change, fetches started before that are not cached
+        self._settings_generation: dict[str, int] = {}
+        # Serializes logins; the epoch counts successful logins so concurrent
+        # requests that hit an expired session only trigger a single re-login
+        self._auth_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        self._auth_epoch = 0
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            # Use Home Assistant's async_get_clientsession helper to avoid blocking SSL calls
-            # This helper handles SSL context creation in the executor to prevent blocking the event loop
-            self._session = async_get_clientsession(self.hass, verify_ssl=False)
+            # Use a dedicated session with its own cookie jar so the PHPSESSID cookie is
+            # kept by aiohttp and sent automatically, without leaking into the shared
+            # Home Assistant session. It still runs on Home Assistant's pooled connector,
+            # so connections are kept alive between polls and SSL setup does not block
+            # the event loop. The config flow has no config entry to clean it up, so the
+            # session is detached in close() instead.
+            self._session = async_create_clientsession(
+                self.hass,
+                verify_ssl=False,
+                auto_cleanup=False,
+                cookie_jar=aiohttp.CookieJar(),
+            )
+            if self.session_id:
+                self._session.cookie_jar.update_cookies({"PHPSESSID": self.session_id}, _SITE_URL)
         return self._session
     
-    async def _get_request(self, url: str) -> aiohttp.ClientResponse:
+    async def _get_request(self, url: str) -> str:
         """Make a GET request to the specified URL."""
-        session = await self._get_session()
-        try:
-            async with session.get(
-                url,
-                headers={
-                    "Cookie": f"PHPSESSID={self.session_id}",
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
-                },
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status == 401:
-                    # Session expired, re-authenticate
-                    _LOGGER.warning("Session expired, re-authenticating")
-                    await self.authenticate()
-                    # Retry the request after re-authentication
-                    return await self._get_request(url)
-                elif response.status != 200:
-                    _LOGGER.error(f"API returned status: {response.status}")
-                    raise ConnectionError(f"API returned status {response.status}")
-                return await response.text()
-        except asyncio.TimeoutError as e:
-            raise ConnectionError(f"Timeout fetching URL: {url}") from e
-        except aiohttp.ClientError as e:
-            raise ConnectionError(f"Error fetching URL {url}: {e}") from e
+        return await self._request("GET", url)
 
-    async def _post_request(self, url: str, data: Any) -> aiohttp.ClientResponse:
+    async def _post_request(self, url: str, data: Any) -> str:
         """Make a POST request to the specified URL."""
-        session = await self._get_session()
-        try:
-            async with session.post(
-                url,
-                headers={
-                    "Cookie": f"PHPSESSID={self.session_id}",
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-                    "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
-                },
-                timeout=aiohttp.ClientTimeout(total=10),
-                data=data
-            ) as response:
-                if response.status == 401:
-                    # Session expired, re-authenticate
-                    _LOGGER.info("Session expired, re-authenticating")
-                    await self.authenticate()
-                    # Retry the request after re-authentication
-                    return await self._post_request(url, data)
-                elif response.status != 200:
-                    _LOGGER.error(f"API returned status: {response.status}")
-                    raise ConnectionError(f"API returned status {response.status}")
-                
-                return response
-        except asyncio.TimeoutError as e:
-            raise ConnectionError(f"Timeout fetching URL: {url}") from e
-        except aiohttp.ClientError as e:
-            raise ConnectionError(f"Error fetching URL {url}: {e}") from e
+        return await self._request("POST", url, data=data, headers=_FORM_HEADERS)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: dict[str, str] = _BASE_HEADERS,
+    ) -> str:
+        """Make a request, re-authenticating once if the session has expired.
 
-    async def _fetch_and_parse_html(self, url: str) -> BeautifulSoup:
-        """Fetch URL and return parsed BeautifulSoup object.
-        
-        Args:
-            url: The URL to fetch
-            
         Returns:
-            BeautifulSoup object with parsed HTML content
-            
+            The response body
+
         Raises:
             ConnectionError: If the request fails or returns non-200 status
         """
-        try:
-            html_content = await self._get_request(url)
-            # Parse HTML response
-            soup = BeautifulSoup(html_content, 'html.parser')
-            return soup
-        except asyncio.TimeoutError as e:
-            raise ConnectionError(f"Timeout fetching URL: {url}") from e
-        except aiohttp.ClientError as e:
-            raise ConnectionError(f"Error fetching URL {url}: {e}") from e
+        session = await self._get_session()
+        for attempt in range(_MAX_AUTH_ATTEMPTS):
+            auth_epoch = self._auth_epoch
+            try:
+                async with self._request_semaphore, session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=_TIMEOUT,
+                    data=data
+                ) as response:
+                    if response.status == 200:
+                        # The site always serves UTF-8, skip aiohttp's charset detection
+                        return await response.text(encoding="utf-8", errors="replace")
+                    if response.status != 401:
+                        _LOGGER.debug("API returned status: %s", response.status)
+                        raise ConnectionError(f"API returned status {response.status}")
+            except asyncio.TimeoutError as e:
+                raise ConnectionError(f"Timeout fetching URL: {url}") from e
+            except aiohttp.ClientError as e:
+                raise ConnectionError(f"Error fetching URL {url}: {e}") from e
+
+            # Session expired, re-authenticate after the response has been released
+            if attempt + 1 < _MAX_AUTH_ATTEMPTS:
+                _LOGGER.warning("Session expired, re-authenticating")
+                await self._reauthenticate(auth_epoch)
+
+        raise ConnectionError(f"Still unauthorized after re-authenticating: {url}")
+
+    @staticmethod
+    def _parse_html(html_content: str) -> LexborHTMLParser:
+        """Parse HTML with the Lexbor backend of selectolax.
+
+        Every page goes through here so the parser backend is chosen in one place.
+
+        Args:
+            html_content: The raw HTML to parse
+
+        Returns:
+            LexborHTMLParser object with parsed HTML content
+        """
+        return LexborHTMLParser(html_content)
+
+    async def _get_room_settings(self, room_id: str) -> tuple[str, dict[str, Any]]:
+        """Return the raw settings page of a room and its values, reusing a recent fetch.
+
+        The DOM is dropped as soon as the values have been read, a write parses
+        the cached page again for the parts only it needs.
+        """
+        cached = self._settings_cache.get(room_id)
+        if cached and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL:
+            return cached[1], cached[2]
+        generation = self._settings_generation.get(room_id, 0)
+        html_content = await self._get_request(f"https://www.mywavinhome.com/settings/{room_id}")
+        settings = self._parse_settings_page(html_content)
+        if generation != self._settings_generation.get(room_id, 0):
+            # The page was requested before a write to the room and may predate it
+            return html_content, settings
+        now = time.monotonic()
+        # Drop entries of earlier polls, they would only be replaced by the next one
+        for expired in [key for key, (ts, _, _) in self._settings_cache.items() if now - ts >= _SETTINGS_CACHE_TTL]:
+            del self._settings_cache[expired]
+        self._settings_cache[room_id] = (now, html_content, settings)
+        return html_content, settings
+
+    def _invalidate_room_settings(self, room_id: str) -> None:
+        """Drop the cached settings of a room, including fetches still in flight."""
+        self._settings_generation[room_id] = self._settings_generation.get(room_id, 0) + 1
+        self._settings_cache.pop(room_id, None)
+
+    def _parse_settings_page(self, html_content: str) -> dict[str, Any]:
+        """Extract the target temperature and state images of a settings page."""
+        tree = self._parse_html(html_content)
+        target_temperature = tree.css_first(_TARGET_TEMP_SEL)
+        return {
+            "target_temperature": target_temperature.text() if target_temperature else "",
+            # Collect all status images in one pass instead of one selector walk per flag
+            "images": frozenset(node.attributes.get("src") for node in tree.css(_IMAGES_SEL)),
+        }
+
+    async def _ensure_authenticated(self) -> None:
+        """Log in unless a session has already been established."""
+        if not self.session_id:
+            await self._reauthenticate(self._auth_epoch)
+
+    async def _reauthenticate(self, seen_epoch: int) -> None:
+        """Log in again unless another caller already did since seen_epoch."""
+        async with self._auth_lock:
+            if self._auth_epoch == seen_epoch:
+                await self.authenticate()
 
     async def authenticate(self) -> str:
         """Authenticate and get session ID."""
         session = await self._get_session()
+        # Start from an empty jar so a stale session cookie is not sent with the login
+        session.cookie_jar.clear()
         
         try:
-            _LOGGER.debug(f"Logging in {self.username}")
+            _LOGGER.debug("Logging in %s", self.username)
 
             async with session.post(
                 f"https://www.mywavinhome.com/login",
@@ -130,153 +227,173 @@ class HVACApiClient:
                     "username": self.username,
                     "password": self.password
                 },
-                headers={"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"},
-                timeout=aiohttp.ClientTimeout(total=10)
+                headers=_BASE_HEADERS,
+                timeout=_TIMEOUT
             ) as response:
                 _LOGGER.debug("Response status: %s", response.status)
                 if response.status == 401:
                     _LOGGER.error("Invalid username or password")
                     raise AuthenticationError("Invalid username or password")
                 elif response.status != 200:
-                    _LOGGER.error("Invalid username or password")
+                    _LOGGER.debug("Login returned status %s", response.status)
                     raise ConnectionError(f"API returned status {response.status}")
                 
-                # Extract session ID from Set-Cookie header
-                set_cookie = response.headers.get("Set-Cookie", "")
-                self.session_id = None
-                _LOGGER.debug("Set-Cookie header: %s", set_cookie)
-                # Parse session ID from cookie string (assuming format like "PHPSESSID=abc123; Path=/")
-                if "PHPSESSID=" in set_cookie:
-                    start = set_cookie.find("PHPSESSID=") + len("PHPSESSID=")
-                    end = set_cookie.find(";", start)
-                    if end == -1:
-                        end = len(set_cookie)
-                    self.session_id = set_cookie[start:end].strip()
-                            # Extract PHPSESSID from cookie jar
-                if not self.session_id:           
-                    for cookie in session.cookie_jar:
-                        if cookie.key == "PHPSESSID":
-                            _LOGGER.info("Reused session id from cookie jar: %s", cookie.value)
-                            self.session_id = cookie.value
-                            break
+                # The login response stores PHPSESSID in the session's cookie jar
+                morsel = session.cookie_jar.filter_cookies(_SITE_URL).get("PHPSESSID")
+                self.session_id = morsel.value if morsel else None
             
                 if not self.session_id:
-                    _LOGGER.error("No session ID found in Set-Cookie header")
-                    raise AuthenticationError("No session ID found in Set-Cookie header")
-                _LOGGER.info("Session ID: %s", self.session_id)
-                _LOGGER.info("Successfully authenticated with MyWavinHome Website")
+                    _LOGGER.debug("No session ID found in login response")
+                    raise AuthenticationError("No session ID found in login response")
+                _LOGGER.debug("Successfully authenticated with MyWavinHome Website")
+                self._auth_epoch += 1
                 return self.session_id
                 
         except asyncio.TimeoutError as e:
-            _LOGGER.error("Timeout connecting to MyWavinHome Website: %s", e)
+            _LOGGER.debug("Timeout connecting to MyWavinHome Website: %s", e)
             raise ConnectionError("Timeout connecting to MyWavinHome Website") from e
         except aiohttp.ClientError as e:
-            _LOGGER.error("Error connecting to MyWavinHome Website: %s", e)
+            _LOGGER.debug("Error connecting to MyWavinHome Website: %s", e)
             raise ConnectionError(f"Error connecting to MyWavinHome Website: {e}") from e
 
     async def get_room_temperatures(self) -> dict[str, Any]:
         """Get temperature data for all rooms."""
-        if not self.session_id:
-            await self.authenticate()
+        await self._ensure_authenticated()
         
-        rooms = await self._fetch_and_parse_rooms(page_number=1)
-
-        # Fetch target temperature for each room
-        for room_id in rooms.keys():
-            room_details = await self.get_room_details(room_id)
+        rooms = await self._fetch_and_parse_rooms()
+
+        # Fetch target temperature for each room concurrently, the settings
+        # pages are independent of each other
+        room_ids = list(rooms.keys())
+        details_list = await asyncio.gather(
+            *(self.get_room_details(room_id) for room_id in room_ids),
+            return_exceptions=True,
+        )
+        for room_id, room_details in zip(room_ids, details_list):
+            if isinstance(room_details, BaseException):
+                _LOGGER.warning("Fetching details for room %s failed: %s", room_id, room_details)
+                continue
             rooms[room_id].update(room_details)
         return rooms
 
     async def get_room_details(self, room_id: str) -> dict[str, Any]:
         """Get room target temperature data."""
-        if not self.session_id:
-            await self.authenticate()
+        await self._ensure_authenticated()
 
         details = {}
-        soup = await self._fetch_and_parse_html(f"https://www.mywavinhome.com/settings/{room_id}")
-        targetTemperature = soup.select_one('#myModeVal')
-
-        if targetTemperature and targetTemperature.text:
-            details["target_temperature"] = targetTemperature.text[:-2]
-        heatingNode = soup.select_one('[src="/images/heat_1.png"]')
-
-        if heatingNode:
-            details["is_heating_on"] = True
-
-        coolingNode = soup.select_one('[src="/images/cool_1.png"]')
+        _, settings = await self._get_room_settings(room_id)
 
-        if coolingNode:
-            details["is_cooling_on"] = True
-        dayModeNode = soup.select_one('[src="/images/day_1.png"]')
+        if settings["target_temperature"]:
+            details["target_temperature"] = settings["target_temperature"][:-2]
 
-        if dayModeNode:
-            details["is_day_mode_on"] = True
-        nightModeNode = soup.select_one('[src="/images/night_1.png"]')
-
-        if nightModeNode:
-            details["is_night_mode_on"] = True
+        for key, image in _STATE_IMAGES.items():
+            details[key] = image in settings["images"]
 
         return details
 
     async def get_outside_temperature(self) -> str | None:
         """Get outside temperature data."""
-        if not self.session_id:
-            await self.authenticate()
-
-        soup = await self._fetch_and_parse_html("https://www.mywavinhome.com/controls")
-        outsideTemp = soup.select_one('[style="font-size:20px;color:red; font-weight:bold;"]')
-        if outsideTemp and outsideTemp.text:
-            return outsideTemp.text[:-2].replace("°C", "")
-        _LOGGER.error("No outside temperature found in response")
+        await self._ensure_authenticated()
+
+        html_content = await self._get_request("https://www.mywavinhome.com/controls")
+        # The value is a single styled text node, a regex avoids building the DOM
+        match = _OUTSIDE_TEMP_RE.search(html_content)
+        if match and match.group(1).strip():
+            return unescape(match.group(1)).replace("°C", "").strip()
+
+        # Fall back to the full parser in case the markup around the value changed
+        tree = self._parse_html(html_content)
+        outsideTemp = tree.css_first(_OUTSIDE_TEMP_SEL)
+        if outsideTemp and outsideTemp.text():
+            return outsideTemp.text().replace("°C", "").strip()
+        _LOGGER.debug("No outside temperature found in response")
         return None
 
-    async def _fetch_and_parse_rooms(self, page_number: int) -> dict[str, Any]:
-        """Parse room data from HTML content.
-        
+    async def _fetch_and_parse_rooms(self) -> dict[str, Any]:
+        """Fetch and parse all pages of the thermostat list.
+
+        The first page is requested on its own since most homes fit on it. Once
+        it links to a next page, the request for the page after the one being
+        loaded is kept in flight, so each further page costs roughly one
+        round-trip less. The speculative request is cancelled at the last page.
+
+        Returns:
+            Dictionary with room data keyed by room_id
+        """
+        rooms = {}
+        page_number = 1
+        html_content = await self._get_request(self._thermostats_url(page_number))
+        next_page: asyncio.Task[str] | None = None
+        try:
+            while True:
+                page_rooms, has_next_page = self._parse_rooms_from_html(html_content, page_number)
+                rooms.update(page_rooms)
+                if not has_next_page:
+                    return rooms
+                page_number += 1
+                current_page = next_page or asyncio.create_task(
+                    self._get_request(self._thermostats_url(page_number))
+                )
+                next_page = asyncio.create_task(self._get_request(self._thermostats_url(page_number + 1)))
+                html_content = await current_page
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+                # Retrieve the outcome of the discarded request so a failure for a
+                # page past the end is not reported as an unhandled exception
+                next_page.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    @staticmethod
+    def _thermostats_url(page_number: int) -> str:
+        """Return the URL of a thermostat list page."""
+        return f"https://www.mywavinhome.com/thermostats?page={page_number}"
+
+    def _parse_rooms_from_html(self, html_content: str, page_number: int) -> tuple[dict[str, Any], bool]:
+        """Parse room data from a thermostat list page.
+
         Args:
-            soup: The BeautifulSoup object with parsed HTML
+            html_content: The raw HTML of the page
             page_number: The page number being processed (for logging/debugging)
-            
+
         Returns:
-            Dictionary with room data keyed by room_id
+            Tuple of the room data keyed by room_id and whether a next page exists
         """
         try:
-            soup = await self._fetch_and_parse_html(f"https://www.mywavinhome.com/thermostats?page={page_number}")
+            tree = self._parse_html(html_content)
 
             # Extract data from XML - you'll need to adjust these selectors based on the actual HTML structure
             rooms = {}
-            for room in soup.select(".items .listview"):
-                room_name = room.select_one('.thermoInput').get('value', '')
+            for room in tree.css(_ROOM_SEL):
+                room_name = room.css_first(_ROOM_NAME_SEL).attributes.get('value', '') or ''
                 temperature: str = None
                 humidity: str = None
-                id_attribute_link = room.select_one('.thermHeader a').get('href', '')
+                id_attribute_link = room.css_first(_ROOM_LINK_SEL).attributes.get('href', '') or ''
                 # Extract room ID from link like "settings/9130575" -> "9130575"
                 room_id = id_attribute_link.split('/')[-1] if '/' in id_attribute_link else id_attribute_link
-                for thermData in room.select(".thermHeader2"):
-                    text: str = thermData.text
-                    if text.endswith(" rh%"):
-                        humidity = text[:-4]
+                for thermData in room.css(_ROOM_DATA_SEL):
+                    text: str = thermData.text().strip()
+                    if text.endswith("rh%"):
+                        humidity = text.removesuffix("rh%").rstrip()
                     elif text.endswith("°C"):
-                        temperature = text[:-2]
-                _LOGGER.info(f"Room details (page {page_number}, room {room_id}): {room_name}, {temperature}, {humidity}")
+                        temperature = text.removesuffix("°C").rstrip()
+                _LOGGER.debug("Room details (page %s, room %s): %s, %s, %s", page_number, room_id, room_name, temperature, humidity)
 
-                rooms[room_id] = {"name": room_name, "temperature": temperature.strip(), "humidity": humidity.strip()}
+                rooms[room_id] = {"name": room_name, "temperature": temperature, "humidity": humidity}
 
-            # Check for next page AFTER processing all rooms on current page
-            if soup.select_one('.next:not(.hidden)'):
-                # There is a next page, fetch and parse it recursively
-                next_page_rooms = await self._fetch_and_parse_rooms(page_number + 1)
-                rooms.update(next_page_rooms)
-            return rooms
+            return rooms, tree.css_first(_NEXT_PAGE_SEL) is not None
         except Exception as e:
-            _LOGGER.error(f"Error processing HTML (page {page_number}): {e}")
+            _LOGGER.debug("Error processing HTML (page %s): %s", page_number, e)
             raise ConnectionError(f"Error processing response (page {page_number}): {e}")
 
     async def close(self) -> None:
         """Close the API session."""
-        # When using Home Assistant's async_get_clientsession, we don't need to close the session
-        # as it's managed by Home Assistant itself
+        # Detaching leaves Home Assistant's shared connector open for its other users
+        if self._session is not None:
+            self._session.cookie_jar.clear()
+            self._session.detach()
         self._session = None
+        self.session_id = None
+        self._settings_cache.clear()
 
     async def set_room_target_temperature(self, room_id: str, target_temperature: float) -> None:
         """Set target temperature for a room.
@@ -285,78 +402,77 @@ class HVACApiClient:
             room_id: The ID of the room
             target_temperature: The desired target temperature
         """
-        if not self.session_id:
-            await self.authenticate()
+        await self._ensure_authenticated()
 
-        soup = await self._fetch_and_parse_html(f"https://www.mywavinhome.com/settings/{room_id}")
-        current_target_temperature_node = soup.select_one('#myModeVal')
-        current_target_temperature = float(current_target_temperature_node.text[:-2])
+        html_content, settings = await self._get_room_settings(room_id)
+        current_target_temperature = float(settings["target_temperature"][:-2])
         temperature_difference = current_target_temperature - target_temperature
 
         if temperature_difference == 0:
-            _LOGGER.warning(f"Target temperature for room {room_id} is already {target_temperature}°C, no update needed.")
+            _LOGGER.debug("Target temperature for room %s is already %s°C, no update needed", room_id, target_temperature)
             return
         
-        temperature_selector_buttons = soup.select('#thermostatBG div[onclick]')
-        script_tag = soup.select_one('#thermostatBG script')
-        _LOGGER.warning(f"Script tag content: {script_tag.string if script_tag else 'None'}")
-        if not script_tag or not script_tag.string:
-            _LOGGER.warning(f"No script tag found for room {room_id}.")
+        # The selector buttons are only needed here, so they are not read on every poll
+        tree = self._parse_html(html_content)
+        # (id, onclick) of the temperature selector buttons, in page order
+        temperature_selector_buttons = [
+            (node.attributes.get("id") or "", node.attributes.get("onclick") or "")
+            for node in tree.css(_TEMP_BUTTONS_SEL)
+        ]
+        script_tag = tree.css_first(_TEMP_SCRIPT_SEL)
+        script = script_tag.text() if script_tag else ""
+        if not script:
+            _LOGGER.warning("No script tag found for room %s", room_id)
             return
-        matched_element_id = re.search(r"\$\('#([a-zA-Z0-9]*)'\)", script_tag.string if script_tag else '')
+        matched_element_id = _SCRIPT_ID_RE.search(script)
         if not matched_element_id:
-            _LOGGER.warning(f"No matched element ID found for room {room_id}.")
+            _LOGGER.warning("No matched element ID found for room %s", room_id)
             return
         if not temperature_selector_buttons:
-            _LOGGER.warning(f"No temperature selector buttons found for room {room_id}. No elements matched.")
+            _LOGGER.warning("No temperature selector buttons found for room %s. No elements matched.", room_id)
             return
         # throw an exception if the temperature_selector_buttons array is empty
         if len(temperature_selector_buttons) == 0:
-            _LOGGER.warning(f"No temperature selector buttons found for room {room_id}. Empty array.")
+            _LOGGER.warning("No temperature selector buttons found for room %s. Empty array.", room_id)
             return
         
-        # Debug: Log all style attributes to see what we're working with
-        _LOGGER.info(f"Found {len(temperature_selector_buttons)} temperature selector buttons for room {room_id}")
-        for i, selector in enumerate(temperature_selector_buttons):
-            id_attribute = selector.attrs.get("id", "")
-            _LOGGER.error(f"Button {i} id: '{id_attribute}' (type: {type(id_attribute)})")
-
-        current_target_temperature_selector_index = next(
-            (
-                i
-                for i, selector in enumerate(temperature_selector_buttons)
-                if matched_element_id and matched_element_id.group(1) == selector.attrs.get("id", "")
-            ),
-            None,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Script tag content for room %s: %s", room_id, script)
+            _LOGGER.debug("Found %s temperature selector buttons for room %s", len(temperature_selector_buttons), room_id)
+            for i, (button_id, _) in enumerate(temperature_selector_buttons):
+                _LOGGER.debug("Button %s id: '%s'", i, button_id)
+
+        button_index_by_id = {
+            button_id: i for i, (button_id, _) in enumerate(temperature_selector_buttons)
+        }
+        current_target_temperature_selector_index = button_index_by_id.get(matched_element_id.group(1))
         if current_target_temperature_selector_index is None:
-            _LOGGER.warning(f"Could not find temperature selector buttons for room {room_id}")
+            _LOGGER.warning("Could not find temperature selector buttons for room %s", room_id)
             return
-        _LOGGER.error(f"Current target temperature selector index for room {room_id}: {current_target_temperature_selector_index}, ({temperature_selector_buttons[current_target_temperature_selector_index].attrs.get('id', '') if current_target_temperature_selector_index is not None else 'N/A'})")
+        _LOGGER.debug("Current target temperature selector index for room %s: %s", room_id, current_target_temperature_selector_index)
         new_target_temperature_selector_index = current_target_temperature_selector_index - int(temperature_difference)
         if new_target_temperature_selector_index < 0 or new_target_temperature_selector_index >= len(temperature_selector_buttons):
-            _LOGGER.warning(f"Calculated selector index {new_target_temperature_selector_index} is out of bounds for room {room_id}")
+            _LOGGER.warning("Calculated selector index %s is out of bounds for room %s", new_target_temperature_selector_index, room_id)
             return
-        _LOGGER.error(f"New target temperature selector index for room {room_id}: {new_target_temperature_selector_index}, ({temperature_selector_buttons[new_target_temperature_selector_index].attrs.get('id', '') if current_target_temperature_selector_index is not None else 'N/A'})")
+        _LOGGER.debug("New target temperature selector index for room %s: %s", room_id, new_target_temperature_selector_index)
 
-        target_selector_button = temperature_selector_buttons[new_target_temperature_selector_index]
         # The expected content is `javascript:setTemperature(1,995045,0);`
         # We need to extract the parameters from this string to make the API call
-        js_content = target_selector_button.get("onclick", "")
+        _, js_content = temperature_selector_buttons[new_target_temperature_selector_index]
         if not js_content.startswith("javascript:setTemperature"):
-            _LOGGER.warning(f"Unexpected javascript content for temperature selector button: {js_content}")
+            _LOGGER.warning("Unexpected javascript content for temperature selector button: %s", js_content)
             return
         
         params_start = js_content.find("(") + 1
         params_end = js_content.find(")")
         params = js_content[params_start:params_end].split(",")
         if len(params) != 3:
-            _LOGGER.warning(f"Unexpected number of parameters in javascript content: {js_content}")
+            _LOGGER.warning("Unexpected number of parameters in javascript content: %s", js_content)
             return
         # Prepare and send the API request to set the temperature
         param_temperature_value = params[1]
         param_room_id = params[0]
-        _LOGGER.warning(f"Setting target temperature for room {room_id} to {target_temperature}°C using parameters: id={param_room_id}, value={param_temperature_value}")
+        _LOGGER.debug("Setting target temperature for room %s to %s°C using parameters: id=%s, value=%s", room_id, target_temperature, param_room_id, param_temperature_value)
         await self._post_request(
             "https://www.mywavinhome.com/settemperature",
             data={
@@ -364,3 +480,5 @@ class HVACApiClient:
                 "value": param_temperature_value
             }
         )
+        # The cached page no longer reflects the new target temperature
+        self._invalidate_room_settings(room_id)
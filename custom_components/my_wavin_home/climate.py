@@ -1,5 +1,6 @@
 """Climate platform for HVAC System."""
 import logging
+import sys
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -9,14 +10,25 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
+from .const import DOMAIN
+from .entity import build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class _RoomLoggerAdapter(logging.LoggerAdapter):
+    """Prefix log messages with the room they are about.
+
+    The prefix is only built for records that pass the level check.
+    """
+
+    def process(self, msg, kwargs):
+        return f"{self.extra['room']}: {msg}", kwargs
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -25,13 +37,26 @@ async def async_setup_entry(
     """Set up HVAC climate entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    # Create a climate entity for each room
-    entities = []
-    if coordinator.data:
-        for room_id, room_data in coordinator.data.items():
-            entities.append(HVACClimate(coordinator, entry, room_id, room_data))
-    
-    async_add_entities(entities)
+    known_rooms: set[str] = set()
+
+    @callback
+    def _check_new_rooms() -> None:
+        """Create a climate entity for each room not seen before."""
+        new_rooms = [
+            (room_id, room_data)
+            for room_id, room_data in (coordinator.data or {}).items()
+            if room_id not in known_rooms
+        ]
+        if not new_rooms:
+            return
+        known_rooms.update(room_id for room_id, _ in new_rooms)
+        async_add_entities([
+            HVACClimate(coordinator, entry, room_id, room_data)
+            for room_id, room_data in new_rooms
+        ])
+
+    _check_new_rooms()
+    entry.async_on_unload(coordinator.async_add_listener(_check_new_rooms))
 
 class HVACClimate(CoordinatorEntity, ClimateEntity):
     """Climate entity for a room."""
@@ -46,45 +71,48 @@ class HVACClimate(CoordinatorEntity, ClimateEntity):
     def __init__(self, coordinator, entry, room_id, room_data):
         """Initialize the climate entity."""
         super().__init__(coordinator)
-        self.room_id = room_id
+        # Interned like the coordinator's keys so data lookups compare by identity
+        self.room_id = sys.intern(room_id)
         self._attr_unique_id = f"{entry.entry_id}_{room_id}_climate"
         # Use room_id as the name since that's the actual room name from the API
         self._attr_name = f"{room_id} Climate"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_{room_id}")},
-            "name": room_data.get("name"),
-            "manufacturer": "Wavin",
-            "model": f"WTC-NET1 - {room_id}",
-        }
+        self._attr_device_info = build_device_info(entry.entry_id, room_id, room_data.name)
+        self._log = _RoomLoggerAdapter(_LOGGER, {"room": self.room_id})
 
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        if self.coordinator.data and self.room_id in self.coordinator.data:
-            temp = self.coordinator.data[self.room_id].get("target_temperature")
-            return float(temp) if temp is not None else None
-        return None
+        data = self.coordinator.data
+        room = data.get(self.room_id) if data else None
+        if room is None:
+            return None
+        temp = room.target_temperature
+        return float(temp) if temp is not None else None
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        if self.coordinator.data and self.room_id in self.coordinator.data:
-            temp = self.coordinator.data[self.room_id].get("target_temperature")
-            return float(temp) if temp is not None else None
-        return None
+        data = self.coordinator.data
+        room = data.get(self.room_id) if data else None
+        if room is None:
+            return None
+        temp = room.target_temperature
+        return float(temp) if temp is not None else None
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current operation mode."""
-        if self.coordinator.data and self.room_id in self.coordinator.data:
-            room_data = self.coordinator.data[self.room_id]
-            # For now, always return HEAT mode when temperature data is available
-            # You can extend this logic based on your API's response structure
-            if room_data.get("is_heating_on") is True:
-                return HVACMode.HEAT
-            if room_data.get("is_cooling_on") is True:
-                return HVACMode.COOL
+        data = self.coordinator.data
+        room_data = data.get(self.room_id) if data else None
+        if room_data is None:
+            return HVACMode.OFF
+        # For now, always return HEAT mode when temperature data is available
+        # You can extend this logic based on your API's response structure
+        if room_data.is_heating_on:
+            return HVACMode.HEAT
+        if room_data.is_cooling_on:
+            return HVACMode.COOL
         return HVACMode.OFF
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -93,24 +121,16 @@ class HVACClimate(CoordinatorEntity, ClimateEntity):
         if temperature is None:
             return
 
-        await self.coordinator.api_client.set_room_target_temperature(self.room_id, temperature)
+        self._log.debug("Setting target temperature to %s", temperature)
+        await self.coordinator.async_set_room_target_temperature(self.room_id, temperature)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         # TODO: Implement API call to set HVAC mode
         # This requires extending your API client with room control methods
-        _LOGGER.warning(
-            "Setting HVAC mode not yet implemented. "
-            "Room: %s, Mode: %s", 
-            self.room_id, 
-            hvac_mode
-        )
+        self._log.warning("Setting HVAC mode not yet implemented, mode: %s", hvac_mode)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.room_id in self.coordinator.data
-        )
\ No newline at end of file
+        return self.room_id in self.coordinator.room_ids and self.coordinator.has_usable_data()
\ No newline at end of file
@@ -9,11 +9,10 @@ from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .api import HVACApiClient, AuthenticationError, ConnectionError as APIConnectionError
+from .const import DATA_BOOTSTRAP_SESSIONS, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN = "my_wavin_home"
-
 class HVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for My Wavin Home."""
 
@@ -26,14 +25,18 @@ class HVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
+            # Test the credentials
+            api_client = HVACApiClient(
+                user_input[CONF_USERNAME],
+                user_input[CONF_PASSWORD],
+                self.hass
+            )
             try:
-                # Test the credentials
-                api_client = HVACApiClient(
-                    user_input[CONF_USERNAME],
-                    user_input[CONF_PASSWORD],
-                    self.hass
-                )
                 await api_client.authenticate()
+                # Hand the session over to the coordinator so it does not log in again
+                self.hass.data.setdefault(DATA_BOOTSTRAP_SESSIONS, {})[
+                    user_input[CONF_USERNAME]
+                ] = api_client.session_id
                 
                 # Create the entry
                 return self.async_create_entry(
@@ -44,9 +47,15 @@ class HVACConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "invalid_auth"
             except APIConnectionError:
                 errors["base"] = "cannot_connect"
-            except Exception as e:
-                _LOGGER.exception("Unexpected exception: %s", e)
+            except Exception as e:  # pylint: disable=broad-except
+                # CancelledError is a BaseException and is not caught here; the
+                # traceback is only formatted when debug logging is enabled
+                _LOGGER.warning(
+                    "Unexpected exception: %s", e, exc_info=_LOGGER.isEnabledFor(logging.DEBUG)
+                )
                 errors["base"] = "unknown"
+            finally:
+                await api_client.close()
 
         return self.async_show_form(
             step_id="user",
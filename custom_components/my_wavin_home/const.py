@@ -1 +1,3 @@
 DOMAIN = "my_wavin_home"
+# Session IDs from config flow logins, keyed by username, used once by the coordinator
+DATA_BOOTSTRAP_SESSIONS = f"{DOMAIN}_bootstrap_sessions"
@@ -1,30 +1,56 @@
 """DataUpdateCoordinator for HVAC System."""
+import asyncio
 import logging
+import sys
+import time
 from datetime import timedelta
-from typing import Any
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
 from .api import HVACApiClient, ConnectionError
+from .const import DATA_BOOTSTRAP_SESSIONS
+from .models import RoomState
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(minutes=15)
+# The interval drops to the minimum as soon as a room temperature moves and doubles
+# after every STABLE_POLLS_BEFORE_BACKOFF polls without change, up to the maximum
+MIN_UPDATE_INTERVAL = timedelta(minutes=2)
+MAX_UPDATE_INTERVAL = timedelta(minutes=30)
+STABLE_POLLS_BEFORE_BACKOFF = 3
+TEMPERATURE_CHANGE_THRESHOLD = 0.1
+# Refreshes requested after writes within this many seconds are merged into one
+REQUEST_REFRESH_COOLDOWN = 1.5
+# Outside temperature changes slowly, it is fetched at most this often
+OUTSIDE_TEMPERATURE_TTL = timedelta(minutes=15)
+# After a failed poll the last good data is served as-is while younger than FRESH_TTL,
+# revalidated in the background once older, and dropped after SWR_TTL. The window
+# covers a full poll at the slowest interval.
+FRESH_TTL = timedelta(minutes=10)
+SWR_TTL = MAX_UPDATE_INTERVAL + FRESH_TTL
 
 class HVACDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching HVAC data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize."""
+        # The client's session runs on Home Assistant's shared connector, so the
+        # requests of every poll reuse the same keep-alive connections
         self.api_client = HVACApiClient(
             entry.data[CONF_USERNAME],
             entry.data[CONF_PASSWORD],
-            hass
+            hass,
+            session_id=hass.data.get(DATA_BOOTSTRAP_SESSIONS, {}).pop(
+                entry.data[CONF_USERNAME], None
+            ),
         )
         
         super().__init__(
@@ -32,23 +58,192 @@ class HVACDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="My Wavin home",
             update_interval=UPDATE_INTERVAL,
+            # Room data is a plain dict, only notify entities when it actually changed
+            always_update=False,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
+        self._last_success_ts: float | None = None
+        self._background_refresh: asyncio.Task | None = None
+        # Fetches and background refreshes still running, cancelled on shutdown
+        self._bg_tasks: set[asyncio.Future] = set()
+        self._unsub_stale_expiry: CALLBACK_TYPE | None = None
+        self._stable_count = 0
+        self._prev_snapshot: dict[str, float] | None = None
+        self._inflight: asyncio.Future[dict[str, RoomState]] | None = None
+        # Counts completed writes; a fetch started before the latest one is not joined
+        self._write_count = 0
+        self._inflight_write_count = 0
+        # (value, time.monotonic() of the fetch)
+        self._outside_cache: tuple[str | None, float | None] = (None, None)
+        # Room ids in the current data, only rebuilt when rooms come or go
+        self.room_ids: frozenset[str] = frozenset()
+
+    async def _async_update_data(self) -> dict[str, RoomState]:
+        """Fetch data from API, joining a fetch that is already in progress.
+
+        Refreshes requested at the same time (e.g. update_entity on several
+        entities) all wait for the same set of requests to the website. A fetch
+        started before the latest write may miss it, so it is not joined.
+        """
+        if self._inflight is None or self._inflight_write_count != self._write_count:
+            self._inflight = self._track_task(asyncio.ensure_future(self._do_fetch()))
+            self._inflight_write_count = self._write_count
+            self._inflight.add_done_callback(self._clear_inflight)
+        # Shielded so a cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(self._inflight)
+
+    def _track_task(self, task: asyncio.Future) -> asyncio.Future:
+        """Remember a task until it is done so shutdown can cancel it."""
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    def _clear_inflight(self, future: asyncio.Future) -> None:
+        """Allow the next refresh to start a new fetch."""
+        # A fetch superseded after a write must not clear the one that replaced it
+        if self._inflight is future:
+            self._inflight = None
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def async_set_room_target_temperature(self, room_id: str, temperature: float) -> None:
+        """Set the target temperature of a room and refresh the data after it."""
+        await self.api_client.set_room_target_temperature(room_id, temperature)
+        self._write_count += 1
+        # Debounced, so a burst of slider changes results in a single refresh
+        await self.async_request_refresh()
+
+    async def _do_fetch(self) -> dict[str, RoomState]:
         """Fetch data from API."""
         try:
-            temperatures = await self.api_client.get_room_temperatures()
-            outside_temperature = await self.api_client.get_outside_temperature()
-            if outside_temperature is not None:
-                temperatures["outside_temperature"] = {
-                    "name": "Outside",
-                    "temperature": outside_temperature,
-                    "humidity": None
-                }
-            return temperatures
+            outside_temperature, outside_ts = self._outside_cache
+            refresh_outside = (
+                outside_ts is None
+                or time.monotonic() - outside_ts > OUTSIDE_TEMPERATURE_TTL.total_seconds()
+            )
+            # The controls page does not depend on the thermostat pages, fetch both
+            # concurrently; the API client makes sure only one of them logs in
+            fetches = [self.api_client.get_room_temperatures()]
+            if refresh_outside:
+                fetches.append(self.api_client.get_outside_temperature())
+            results = await asyncio.gather(*fetches)
+            temperatures = results[0]
+            if refresh_outside:
+                outside_temperature = results[1]
+                self._outside_cache = (outside_temperature, time.monotonic())
         except ConnectionError as err:
+            self._schedule_stale_expiry()
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        # Keys are interned so entity lookups of the same room id compare by identity
+        rooms = {
+            sys.intern(room_id): RoomState.from_dict(room)
+            for room_id, room in temperatures.items()
+        }
+        # Only the rooms decide the polling interval, the outside temperature moves
+        # between almost any two fetches
+        self._adapt_update_interval(rooms)
+        if outside_temperature is not None:
+            rooms["outside_temperature"] = RoomState(
+                name="Outside",
+                temperature=outside_temperature,
+            )
+        if rooms.keys() != self.room_ids:
+            self.room_ids = frozenset(rooms)
+        self._last_success_ts = time.monotonic()
+        self._cancel_stale_expiry()
+        return rooms
+
+    def _adapt_update_interval(self, data: dict[str, RoomState]) -> None:
+        """Poll faster while temperatures change and slower while they are stable.
+
+        The base class schedules the next refresh with the new interval once the
+        current update has finished.
+        """
+        snapshot = {}
+        for room_id, room in data.items():
+            try:
+                snapshot[room_id] = float(room.temperature)
+            except (TypeError, ValueError):
+                continue
+        previous, self._prev_snapshot = self._prev_snapshot, snapshot
+        if previous is None:
+            return
+
+        changed = snapshot.keys() != previous.keys() or any(
+            abs(temperature - previous[room_id]) > TEMPERATURE_CHANGE_THRESHOLD
+            for room_id, temperature in snapshot.items()
+        )
+        if changed:
+            self._stable_count = 0
+            self.update_interval = MIN_UPDATE_INTERVAL
+            return
+
+        self._stable_count += 1
+        if self._stable_count >= STABLE_POLLS_BEFORE_BACKOFF:
+            self._stable_count = 0
+            self.update_interval = min(self.update_interval * 2, MAX_UPDATE_INTERVAL)
+
+    def has_usable_data(self) -> bool:
+        """Return if entities can show the last fetched data.
+
+        After a failed poll the previous data stays usable for SWR_TTL. Once it is
+        older than FRESH_TTL a background refresh is started to revalidate it.
+        """
+        # An empty dict means the first refresh has not returned yet
+        if not self.data:
+            return False
+        if self.last_update_success:
+            return True
+        if self._last_success_ts is None:
+            return False
+        age = time.monotonic() - self._last_success_ts
+        if age > FRESH_TTL.total_seconds():
+            self._schedule_background_refresh()
+        return age < SWR_TTL.total_seconds()
+
+    @callback
+    def _schedule_background_refresh(self) -> None:
+        """Start a refresh that does not block the caller, unless one is running."""
+        if self._background_refresh is not None and not self._background_refresh.done():
+            return
+        self._background_refresh = self._track_task(
+            self.hass.async_create_background_task(
+                self.async_refresh(), f"{self.name} background refresh"
+            )
+        )
+
+    @callback
+    def _schedule_stale_expiry(self) -> None:
+        """Notify entities once the last good data is too old to be served."""
+        if self._last_success_ts is None or self._unsub_stale_expiry is not None:
+            return
+        remaining = SWR_TTL.total_seconds() - (time.monotonic() - self._last_success_ts)
+        self._unsub_stale_expiry = async_call_later(
+            self.hass, max(remaining, 0), self._handle_stale_expiry
+        )
+
+    @callback
+    def _handle_stale_expiry(self, _now) -> None:
+        """Let entities re-evaluate their availability."""
+        self._unsub_stale_expiry = None
+        self.async_update_listeners()
+
+    @callback
+    def _cancel_stale_expiry(self) -> None:
+        """Cancel a pending stale-data notification."""
+        if self._unsub_stale_expiry is not None:
+            self._unsub_stale_expiry()
+            self._unsub_stale_expiry = None
+
     async def async_shutdown(self) -> None:
         """Shutdown coordinator."""
+        await super().async_shutdown()
+        self._cancel_stale_expiry()
+        # Do not let pending requests hold up Home Assistant until they time out
+        tasks = list(self._bg_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Only drops the client's own state, the shared connector stays open
         await self.api_client.close()
\ No newline at end of file
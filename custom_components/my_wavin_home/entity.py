@@ -0,0 +1,14 @@
+"""Shared entity helpers for HVAC System."""
+from typing import Any
+
+from .const import DOMAIN
+
+
+def build_device_info(entry_id: str, room_id: str, name: str | None) -> dict[str, Any]:
+    """Return the device info shared by all entities of a room."""
+    return {
+        "identifiers": {(DOMAIN, f"{entry_id}_{room_id}")},
+        "name": name,
+        "manufacturer": "Wavin",
+        "model": f"WTC-NET1 - {room_id}",
+    }
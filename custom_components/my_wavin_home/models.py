@@ -0,0 +1,31 @@
+"""Data models for HVAC System."""
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class RoomState:
+    """State of a single room as scraped from MyWavinHome."""
+
+    name: str | None
+    temperature: str | None = None
+    humidity: str | None = None
+    target_temperature: str | None = None
+    is_heating_on: bool = False
+    is_cooling_on: bool = False
+    is_day_mode_on: bool = False
+    is_night_mode_on: bool = False
+
+    @classmethod
+    def from_dict(cls, room: dict[str, Any]) -> "RoomState":
+        """Create a room state from the dict returned by the API client."""
+        return cls(
+            name=room.get("name"),
+            temperature=room.get("temperature"),
+            humidity=room.get("humidity"),
+            target_temperature=room.get("target_temperature"),
+            is_heating_on=room.get("is_heating_on", False),
+            is_cooling_on=room.get("is_cooling_on", False),
+            is_day_mode_on=room.get("is_day_mode_on", False),
+            is_night_mode_on=room.get("is_night_mode_on", False),
+        )
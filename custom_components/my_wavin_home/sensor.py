@@ -1,22 +1,41 @@
 """Sensor platform for HVAC System."""
 import logging
+import sys
 
-from custom_components.my_wavin_home.climate import HVACClimate
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import DOMAIN
+from .const import DOMAIN
+from .entity import build_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# The key of each description is the RoomState attribute the sensor reports
+TEMPERATURE_SENSOR = SensorEntityDescription(
+    key="temperature",
+    name="Temperature",
+    device_class=SensorDeviceClass.TEMPERATURE,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+)
+HUMIDITY_SENSOR = SensorEntityDescription(
+    key="humidity",
+    name="Humidity",
+    device_class=SensorDeviceClass.HUMIDITY,
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement=PERCENTAGE,
+)
+SENSOR_TYPES = (TEMPERATURE_SENSOR, HUMIDITY_SENSOR)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -25,87 +44,55 @@ async def async_setup_entry(
     """Set up HVAC sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    # Create temperature and humidity sensors for each room
-    entities = []
-    if coordinator.data:
-        for room_id, room_data in coordinator.data.items():
-            entities.append(HVACTemperatureSensor(coordinator, entry, room_id, room_data))
-            if room_id != "outside_temperature":
-                entities.append(HVACHumiditySensor(coordinator, entry, room_id, room_data))
-    
-    async_add_entities(entities)
-
-class HVACTemperatureSensor(CoordinatorEntity, SensorEntity):
-    """Temperature sensor for a room."""
-
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-
-    def __init__(self, coordinator, entry, room_id, room_data):
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.room_id = room_id
-        self._attr_unique_id = f"{entry.entry_id}_{room_id}_temperature"
-        # Use room_id as the name since that's the actual room name from the API
-        self._attr_name = f"{room_id} Temperature"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_{room_id}")},
-            "name": room_id,  # room_id is actually the room name
-            "manufacturer": "Wavin",
-            "model": f"Room Sensor - {room_id}",
-        }
-
-    @property
-    def native_value(self):
-        """Return the temperature."""
-        if self.coordinator.data and self.room_id in self.coordinator.data:
-            return self.coordinator.data[self.room_id].get("temperature")
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.room_id in self.coordinator.data
-        )
+    known_rooms: set[str] = set()
 
+    @callback
+    def _check_new_rooms() -> None:
+        """Create temperature and humidity sensors for rooms not seen before."""
+        new_rooms = [
+            (room_id, room_data)
+            for room_id, room_data in (coordinator.data or {}).items()
+            if room_id not in known_rooms
+        ]
+        if not new_rooms:
+            return
+        known_rooms.update(room_id for room_id, _ in new_rooms)
+        async_add_entities([
+            HVACRoomSensor(coordinator, entry, room_id, room_data, description)
+            for room_id, room_data in new_rooms
+            for description in (
+                SENSOR_TYPES if room_id != "outside_temperature" else (TEMPERATURE_SENSOR,)
+            )
+        ])
 
-class HVACHumiditySensor(CoordinatorEntity, SensorEntity):
-    """Humidity sensor for a room."""
+    _check_new_rooms()
+    entry.async_on_unload(coordinator.async_add_listener(_check_new_rooms))
 
-    _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
+class HVACRoomSensor(CoordinatorEntity, SensorEntity):
+    """Temperature or humidity sensor for a room."""
 
-    def __init__(self, coordinator, entry, room_id, room_data):
+    def __init__(self, coordinator, entry, room_id, room_data, description: SensorEntityDescription):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self.room_id = room_id
-        self._attr_unique_id = f"{entry.entry_id}_{room_id}_humidity"
+        self.entity_description = description
+        self._key = description.key
+        # Interned like the coordinator's keys so data lookups compare by identity
+        self.room_id = sys.intern(room_id)
+        self._attr_unique_id = f"{entry.entry_id}_{room_id}_{description.key}"
         # Use room_id as the name since that's the actual room name from the API
-        self._attr_name = f"{room_id} Humidity"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{entry.entry_id}_{room_id}")},
-            "name": room_id,  # room_id is actually the room name
-            "manufacturer": "Wavin",
-            "model": f"Room Sensor - {room_id}",
-        }
+        self._attr_name = f"{room_id} {description.name}"
+        self._attr_device_info = build_device_info(entry.entry_id, room_id, room_data.name)
 
     @property
     def native_value(self):
-        """Return the humidity."""
-        if self.coordinator.data and self.room_id in self.coordinator.data:
-            return self.coordinator.data[self.room_id].get("humidity")
-        return None
+        """Return the temperature or humidity."""
+        data = self.coordinator.data
+        room = data.get(self.room_id) if data else None
+        if room is None:
+            return None
+        return getattr(room, self._key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.room_id in self.coordinator.data
-        )
\ No newline at end of file
+        return self.room_id in self.coordinator.room_ids and self.coordinator.has_usable_data()
@@ -0,0 +1,242 @@
+"""Test the My Wavin Home API client."""
+import asyncio
+
+from yarl import URL
+
+from custom_components.my_wavin_home.api import HVACApiClient
+
+THERMOSTATS_PAGE = """
+<div class="items">
+  <div class="listview">
+    <div class="thermHeader"><a href="settings/9130575">Living room</a></div>
+    <input class="thermoInput" value="Living room">
+    <div class="thermHeader2">21.5°C</div>
+    <div class="thermHeader2">45 rh%</div>
+  </div>
+</div>
+<a class="next{hidden}" href="#">Next</a>
+"""
+
+
+def _page(room_id: str, last: bool) -> str:
+    return THERMOSTATS_PAGE.replace("9130575", room_id).format(
+        hidden=" hidden" if last else ""
+    )
+
+
+async def test_parse_rooms_from_html(hass):
+    """Test parsing a single thermostat list page."""
+    client = HVACApiClient("user", "pass", hass)
+
+    rooms, has_next_page = client._parse_rooms_from_html(_page("9130575", True), 1)
+
+    assert rooms == {
+        "9130575": {"name": "Living room", "temperature": "21.5", "humidity": "45"}
+    }
+    assert has_next_page is False
+
+
+async def test_fetch_and_parse_rooms_follows_pages(hass):
+    """Test all thermostat list pages are collected."""
+    client = HVACApiClient("user", "pass", hass)
+    pages = {
+        client._thermostats_url(1): _page("1", False),
+        client._thermostats_url(2): _page("2", True),
+    }
+    requested = []
+
+    async def _get_request(url):
+        requested.append(url)
+        return pages.get(url, "")
+
+    client._get_request = _get_request
+
+    rooms = await client._fetch_and_parse_rooms()
+
+    assert list(rooms) == ["1", "2"]
+    assert requested[:2] == [client._thermostats_url(1), client._thermostats_url(2)]
+
+
+async def test_fetch_and_parse_rooms_single_page(hass):
+    """Test a home that fits on one page only requests that page."""
+    client = HVACApiClient("user", "pass", hass)
+    requested = []
+
+    async def _get_request(url):
+        requested.append(url)
+        return _page("1", True)
+
+    client._get_request = _get_request
+
+    rooms = await client._fetch_and_parse_rooms()
+
+    assert list(rooms) == ["1"]
+    assert requested == [client._thermostats_url(1)]
+
+
+async def test_fetch_and_parse_rooms_requests_next_page_ahead(hass):
+    """Test the page after the one being loaded is requested before it returns."""
+    client = HVACApiClient("user", "pass", hass)
+    pages = {
+        client._thermostats_url(1): _page("1", False),
+        client._thermostats_url(2): _page("2", False),
+        client._thermostats_url(3): _page("3", True),
+    }
+    events = []
+
+    async def _get_request(url):
+        events.append(("start", url))
+        await asyncio.sleep(0)
+        events.append(("end", url))
+        return pages.get(url, "")
+
+    client._get_request = _get_request
+
+    rooms = await client._fetch_and_parse_rooms()
+
+    assert list(rooms) == ["1", "2", "3"]
+    assert events.index(("start", client._thermostats_url(3))) < events.index(
+        ("end", client._thermostats_url(2))
+    )
+
+
+async def test_get_outside_temperature(hass):
+    """Test the outside temperature is extracted from the controls page."""
+    client = HVACApiClient("user", "pass", hass)
+    client.session_id = "session"
+
+    async def _get_request(url):
+        return '<span style="font-size:20px;color:red; font-weight:bold;">4.5°C</span>'
+
+    client._get_request = _get_request
+
+    assert await client.get_outside_temperature() == "4.5"
+
+
+async def test_concurrent_reauthentication_logs_in_once(hass):
+    """Test requests hitting an expired session share a single login."""
+    client = HVACApiClient("user", "pass", hass)
+    logins = []
+
+    async def _authenticate():
+        logins.append(1)
+        await asyncio.sleep(0)
+        client.session_id = "session"
+        client._auth_epoch += 1
+        return client.session_id
+
+    client.authenticate = _authenticate
+    seen_epoch = client._auth_epoch
+
+    await asyncio.gather(*(client._reauthenticate(seen_epoch) for _ in range(5)))
+
+    assert len(logins) == 1
+
+
+SETTINGS_PAGE = """
+<div id="myModeVal">21°C</div>
+<div id="thermostatBG">
+  <div id="b20" onclick="javascript:setTemperature(1,995020,0);"></div>
+  <div id="b21" onclick="javascript:setTemperature(1,995021,0);"></div>
+  <div id="b22" onclick="javascript:setTemperature(1,995022,0);"></div>
+  <script type="text/javascript">$('#b21').addClass('selected');</script>
+</div>
+"""
+
+
+async def test_set_room_target_temperature(hass):
+    """Test the button one step above the current target is posted."""
+    client = HVACApiClient("user", "pass", hass)
+    client.session_id = "session"
+    posted = []
+
+    async def _get_request(url):
+        return SETTINGS_PAGE
+
+    async def _post_request(url, data):
+        posted.append(data)
+        return ""
+
+    client._get_request = _get_request
+    client._post_request = _post_request
+
+    await client.set_room_target_temperature("9130575", 22)
+
+    assert posted == [{"id": "9130575", "value": "995022"}]
+
+
+async def test_set_room_target_temperature_ignores_scripts_outside_selector(hass):
+    """Test only a script inside the selector marks the current button."""
+    client = HVACApiClient("user", "pass", hass)
+    client.session_id = "session"
+    posted = []
+
+    async def _get_request(url):
+        return SETTINGS_PAGE.replace(
+            "<script type=\"text/javascript\">$('#b21').addClass('selected');</script>", ""
+        ) + "<script type=\"text/javascript\">$('#b20').show();</script>"
+
+    async def _post_request(url, data):
+        posted.append(data)
+        return ""
+
+    client._get_request = _get_request
+    client._post_request = _post_request
+
+    await client.set_room_target_temperature("9130575", 22)
+
+    assert posted == []
+
+async def test_write_discards_settings_fetched_concurrently(hass):
+    """Test a settings page requested before a write is not cached after it."""
+    client = HVACApiClient("user", "pass", hass)
+    client.session_id = "session"
+    page_requested = asyncio.Event()
+    release_page = asyncio.Event()
+    posted = []
+
+    async def _get_request(url):
+        # The poll's request is answered only after the write has been posted
+        if not page_requested.is_set():
+            page_requested.set()
+            await release_page.wait()
+        return SETTINGS_PAGE
+
+    async def _post_request(url, data):
+        posted.append(data)
+        return ""
+
+    client._get_request = _get_request
+    client._post_request = _post_request
+
+    poll = asyncio.ensure_future(client.get_room_details("9130575"))
+    await page_requested.wait()
+    await client.set_room_target_temperature("9130575", 22)
+    release_page.set()
+    await poll
+
+    assert posted == [{"id": "9130575", "value": "995022"}]
+    assert "9130575" not in client._settings_cache
+
+
+async def test_session_id_seeds_cookie_jar(hass):
+    """Test a session ID from an earlier login is sent without logging in."""
+    client = HVACApiClient("user", "pass", hass, session_id="bootstrap")
+
+    session = await client._get_session()
+
+    cookies = session.cookie_jar.filter_cookies(URL("https://www.mywavinhome.com/"))
+    assert cookies["PHPSESSID"].value == "bootstrap"
+
+    await client.close()
+
+
+async def test_close_detaches_session(hass):
+    """Test closing the client releases its session."""
+    client = HVACApiClient("user", "pass", hass, session_id="bootstrap")
+    session = await client._get_session()
+
+    await client.close()
+
+    assert session.closed
+    assert client._session is None
@@ -0,0 +1,170 @@
+"""Test the My Wavin Home data update coordinator."""
+import asyncio
+from unittest.mock import AsyncMock
+
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.my_wavin_home.api import ConnectionError
+from custom_components.my_wavin_home.const import DOMAIN
+from custom_components.my_wavin_home.coordinator import (
+    FRESH_TTL,
+    MAX_UPDATE_INTERVAL,
+    MIN_UPDATE_INTERVAL,
+    OUTSIDE_TEMPERATURE_TTL,
+    STABLE_POLLS_BEFORE_BACKOFF,
+    SWR_TTL,
+    UPDATE_INTERVAL,
+    HVACDataUpdateCoordinator,
+)
+from custom_components.my_wavin_home.models import RoomState
+
+ROOMS = {"1": {"name": "Living room", "temperature": "21.5", "humidity": "45"}}
+
+
+def _coordinator(hass, rooms=ROOMS, outside="4.5"):
+    """Return a coordinator whose API client serves the given data."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_USERNAME: "user", CONF_PASSWORD: "pass"}
+    )
+    coordinator = HVACDataUpdateCoordinator(hass, entry)
+    calls = {"rooms": 0, "outside": 0}
+
+    async def _get_room_temperatures():
+        calls["rooms"] += 1
+        if isinstance(rooms, Exception):
+            raise rooms
+        return {room_id: dict(room) for room_id, room in rooms.items()}
+
+    async def _get_outside_temperature():
+        calls["outside"] += 1
+        return outside
+
+    coordinator.api_client.get_room_temperatures = _get_room_temperatures
+    coordinator.api_client.get_outside_temperature = _get_outside_temperature
+    return coordinator, calls
+
+
+async def test_stale_data_is_served_within_swr_ttl(hass):
+    """Test the last good data stays usable after a failed poll until SWR_TTL."""
+    coordinator, _ = _coordinator(hass)
+    await coordinator.async_refresh()
+    assert coordinator.has_usable_data()
+
+    async def _fail():
+        raise ConnectionError("Website down")
+
+    coordinator.api_client.get_room_temperatures = _fail
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.has_usable_data()
+    # Entities are told to re-check their availability once the data expires
+    assert coordinator._unsub_stale_expiry is not None
+
+    # Older than FRESH_TTL but within SWR_TTL, still served while revalidating
+    coordinator._last_success_ts -= FRESH_TTL.total_seconds() + 1
+    assert coordinator.has_usable_data()
+
+    coordinator._last_success_ts -= SWR_TTL.total_seconds()
+    assert not coordinator.has_usable_data()
+
+    await coordinator.async_shutdown()
+
+
+async def test_update_interval_backs_off_and_snaps_back(hass):
+    """Test polling slows down while temperatures are stable and speeds up on change."""
+    coordinator, _ = _coordinator(hass)
+    stable = {"1": RoomState(name="Living room", temperature="21.5")}
+
+    coordinator._adapt_update_interval(stable)
+    for _ in range(STABLE_POLLS_BEFORE_BACKOFF):
+        coordinator._adapt_update_interval(stable)
+    assert coordinator.update_interval == min(UPDATE_INTERVAL * 2, MAX_UPDATE_INTERVAL)
+
+    for _ in range(STABLE_POLLS_BEFORE_BACKOFF * 3):
+        coordinator._adapt_update_interval(stable)
+    assert coordinator.update_interval == MAX_UPDATE_INTERVAL
+
+    coordinator._adapt_update_interval(
+        {"1": RoomState(name="Living room", temperature="22.0")}
+    )
+    assert coordinator.update_interval == MIN_UPDATE_INTERVAL
+
+
+async def test_update_interval_ignores_outside_temperature(hass):
+    """Test a changing outside temperature does not keep polling fast."""
+    coordinator, _ = _coordinator(hass)
+
+    for poll in range(STABLE_POLLS_BEFORE_BACKOFF + 1):
+        coordinator._outside_cache = (None, None)
+        coordinator.api_client.get_outside_temperature = AsyncMock(
+            return_value=str(4.5 + poll)
+        )
+        await coordinator.async_refresh()
+
+    assert coordinator.data["outside_temperature"].temperature == "7.5"
+    assert coordinator.update_interval == min(UPDATE_INTERVAL * 2, MAX_UPDATE_INTERVAL)
+
+
+async def test_concurrent_refreshes_share_one_fetch(hass):
+    """Test refreshes started while a fetch is running join that fetch."""
+    coordinator, calls = _coordinator(hass)
+    release = asyncio.Event()
+    get_room_temperatures = coordinator.api_client.get_room_temperatures
+
+    async def _slow_get_room_temperatures():
+        await release.wait()
+        return await get_room_temperatures()
+
+    coordinator.api_client.get_room_temperatures = _slow_get_room_temperatures
+
+    refreshes = asyncio.gather(*(coordinator._async_update_data() for _ in range(3)))
+    await asyncio.sleep(0)
+    release.set()
+    results = await refreshes
+
+    assert calls["rooms"] == 1
+    assert results[0] is results[1] is results[2]
+    assert coordinator._inflight is None
+
+
+async def test_refresh_after_write_starts_new_fetch(hass):
+    """Test a refresh after a write does not join a fetch that started before it."""
+    coordinator, calls = _coordinator(hass)
+    coordinator.api_client.set_room_target_temperature = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+    release = asyncio.Event()
+    get_room_temperatures = coordinator.api_client.get_room_temperatures
+
+    async def _slow_get_room_temperatures():
+        await release.wait()
+        return await get_room_temperatures()
+
+    coordinator.api_client.get_room_temperatures = _slow_get_room_temperatures
+
+    before_write = asyncio.ensure_future(coordinator._async_update_data())
+    await asyncio.sleep(0)
+    await coordinator.async_set_room_target_temperature("1", 22)
+    after_write = asyncio.ensure_future(coordinator._async_update_data())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(before_write, after_write)
+
+    assert calls["rooms"] == 2
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert coordinator._inflight is None
+
+
+async def test_outside_temperature_is_cached(hass):
+    """Test the outside temperature is only fetched again after its TTL."""
+    coordinator, calls = _coordinator(hass)
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert calls == {"rooms": 2, "outside": 1}
+    assert coordinator.data["outside_temperature"].temperature == "4.5"
+
+    value, fetched = coordinator._outside_cache
+    coordinator._outside_cache = (value, fetched - OUTSIDE_TEMPERATURE_TTL.total_seconds() - 1)
+    await coordinator.async_refresh()
+    assert calls == {"rooms": 3, "outside": 2}
@@ -1,9 +1,66 @@
 """Test component setup."""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers import entity_registry as er
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.my_wavin_home.api import ConnectionError, HVACApiClient
 from custom_components.my_wavin_home.const import DOMAIN
 
 
 async def test_async_setup(hass):
     """Test the component gets setup."""
     assert await async_setup_component(hass, DOMAIN, {}) is True
+
+
+async def _setup_entry(hass, room_temperatures):
+    """Set up a config entry and wait for its first refresh."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_USERNAME: "user", CONF_PASSWORD: "pass"}
+    )
+    entry.add_to_hass(hass)
+    with patch.object(
+        HVACApiClient, "get_room_temperatures", room_temperatures
+    ), patch.object(HVACApiClient, "get_outside_temperature", return_value="4.5"):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        # The first refresh runs as a background task of the entry
+        await asyncio.gather(*entry._background_tasks)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_entities_added_after_first_refresh(hass):
+    """Test room entities appear once the background first refresh returns."""
+    entry = await _setup_entry(
+        hass,
+        AsyncMock(
+            return_value={
+                "1": {"name": "Living room", "temperature": "21.5", "humidity": "45"}
+            }
+        ),
+    )
+
+    assert entry.state is ConfigEntryState.LOADED
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    assert {entity.unique_id for entity in entities} >= {
+        f"{entry.entry_id}_1_climate",
+        f"{entry.entry_id}_outside_temperature_temperature",
+    }
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_failed_first_refresh_keeps_entry_loaded(hass):
+    """Test a failing website does not fail the config entry setup."""
+    entry = await _setup_entry(
+        hass, AsyncMock(side_effect=ConnectionError("Website down"))
+    )
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert not er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)